@@ -147,11 +147,12 @@ class Entry:
         Raises:
             UnknownEntryType: Indicates that the entry type is unknown.
         """
+        entry_type = EntryType.classify(guide.peek_word())
         try:
-            return cls._map[EntryType(guide.peek_word())](guide)
-        except (ValueError, KeyError) as error:
+            return cls._map[entry_type](guide)
+        except KeyError as error:
             raise UnknownEntryType(
-                f"Unknown guide entry type: {guide.peek_word()}"
+                f"Unknown guide entry type: {entry_type.value}"
             ) from error
 
     def __init__(self, guide: GuideReader) -> None:
@@ -60,6 +60,13 @@ class NortonGuide:
     CREDIT_LENGTH: Final[int] = 66
     """The length of a line in the credits."""
 
+    SUFFIXES: Final[frozenset[str]] = frozenset((".ng",))
+    """The file suffixes that a Norton Guide database is expected to have.
+
+    Note:
+        These are held in their case-folded form.
+    """
+
     def __init__(self, guide: str | Path) -> None:
         """Constructor.
 
@@ -78,11 +85,14 @@ class NortonGuide:
         # Now, having opened it fine, read in the header.
         self._read_header()
 
+        # Until we know otherwise, assume there are no menus.
+        self._menus: tuple[Menu, ...] = ()
+
         # Having read in the header, does it look like it's a Norton Guide
         # database we've been pointed at?
         if self.is_a:
             # Seems so. In that case sort the menus.
-            self._menus = tuple(menu for menu in self._read_menus())
+            self._menus = tuple(self._read_menus())
 
             # The number of menus should be correct at this point.
             assert len(self._menus) == self._menu_count
@@ -91,6 +101,22 @@ class NortonGuide:
             # let's remember where that is.
             self._first_entry = self._guide.pos
 
+    @classmethod
+    def maybe(cls, candidate: str | Path) -> bool:
+        """Might the given path be a Norton Guide database?
+
+        Args:
+            candidate: The path to test.
+
+        Returns:
+            ``True`` if the path looks like a guide, ``False`` if not.
+
+        Note:
+            This only looks at the name of the file; no attempt is made to
+            open it. For a test of the content of a guide see ``is_a``.
+        """
+        return Path(candidate).suffix.casefold() in cls.SUFFIXES
+
     def _read_header(self) -> None:
         """Read the header of the Norton Guide database."""
 
@@ -114,10 +140,10 @@ class NortonGuide:
     def _read_menus(self) -> Iterator[Menu]:
         """Read the menus from the guide.
 
-        :yields:
+        Yields:
             A menu from the guide.
         """
-        while EntryType.is_menu(self._guide.peek_word()):
+        while EntryType.classify(self._guide.peek_word()) is EntryType.MENU:
             yield Menu(self._guide)
 
     @property
@@ -229,7 +255,7 @@ class NortonGuide:
     @property
     def eof(self) -> bool:
         """Are we at the end of the guide?"""
-        return self._guide.pos >= self.path.stat().st_size
+        return self._guide.pos >= self._guide.size
 
     @not_eof
     def load(self) -> Entry:
@@ -264,7 +290,10 @@ class NortonGuide:
                 # ...and then, assuming the worst (that our caller may have
                 # moved around the guide while consuming that entry), we
                 # pointedly go back to it, skip it and load whatever's next.
-                entry = self.goto(entry.offset).skip().load()
+                # Given we already know the size of the entry we can skip
+                # over it without having to read it again.
+                self._guide.goto(entry.offset).skip_entry_known(entry.size)
+                entry = self.load()
             except NGEOF:
                 # EOF was thrown so let's finish the iterator.
                 break
@@ -10,6 +10,8 @@ from .reader import GuideReader
 class Menu(PromptCollection):
     """Class that loads and holds the details of a menu in the guide."""
 
+    __slots__ = ("_title",)
+
     def __init__(self, guide: GuideReader) -> None:
         """Constructor.
 
@@ -34,7 +36,7 @@ class Menu(PromptCollection):
         guide.skip(20)
 
         # Next up is the collection of offsets for each menu prompt.
-        self._offsets = tuple(guide.read_offset() for _ in range(len(self)))
+        self._offsets = guide.read_offsets(len(self))
 
         # Skip a number of values I don't know the purpose of, but I've
         # never needed. It seems to be two sets of long integer arrays.
@@ -6,13 +6,15 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
+import re
 from abc import ABC, abstractmethod
 from enum import Enum, auto
-from typing import Final
+from functools import lru_cache
+from typing import Callable, ClassVar, Final
 
 ##############################################################################
 # Local imports.
-from .dosify import make_dos_like
+from .dosify import DOS_MAP
 
 
 ##############################################################################
@@ -30,53 +32,64 @@ class TextMode(Enum):
 CTRL_CHAR: Final[str] = "^"
 """The control character that marks an upcoming attribute."""
 
+CTRL_MARKUP: Final[re.Pattern[str]] = re.compile(
+    r"\^([AaCc].{0,2}|[BbNnRrUu^])?", re.DOTALL
+)
+"""Regular expression that matches a single piece of markup.
+
+Note:
+    A control character that isn't followed by something we recognise is
+    still matched, but without a group; this means that a lone ^ (at the
+    end of a line, or in front of something that doesn't make sense as
+    markup) can be skipped. As much as possible the parsing code should do
+    its absolute best to return something readable when faced with invalid
+    markup.
+"""
+
+MARKUP: Final[re.Pattern[str]] = re.compile(f"{CTRL_MARKUP.pattern}|[^^]+", re.DOTALL)
+"""Regular expression that breaks a line into runs of text and markup."""
+
+HEX_DIGITS: Final[str] = "0123456789abcdefABCDEF"
+"""All the characters that can appear in a hex value in markup."""
+
+HEX: Final[dict[str, int]] = {
+    f"{high}{low}": int(f"{high}{low}", 16) for high in HEX_DIGITS for low in HEX_DIGITS
+}
+"""Lookup of the two-digit hex value of a piece of markup to its value.
+
+Note:
+    ``int`` is more forgiving than this (it will take a single digit, or
+    surrounding whitespace), so anything not found here should still be
+    handed to ``int`` to decide if it's valid.
+"""
+
+CHARS: Final[dict[str, str]] = {digits: chr(value) for digits, value in HEX.items()}
+"""Lookup of the two-digit hex value of a ^C markup to the character."""
+
 
 ##############################################################################
-class ParseState:
+class ParseState:  # pylint: disable=too-few-public-methods
     """Raw text parsing state tracking class.
 
     Attributes:
-        ctrl: The location of the next control marker.
-        raw: The current raw text that's left to handle.
         mode: The current mode.
         last_attr: The last attribute encountered.
     """
 
-    def __init__(self, line: str) -> None:
-        """Constructor.
+    __slots__ = ("mode", "last_attr")
 
-        Args:
-            line: The line to work on.
-        """
-        self.raw = line
-        self.ctrl = line.find(CTRL_CHAR)
+    def __init__(self) -> None:
+        """Constructor."""
         self.mode = TextMode.NORMAL
         self.last_attr = -1
 
-    @property
-    def work_left(self) -> bool:
-        """Is there any work left to do?"""
-        return self.ctrl != -1 and self.ctrl < len(self.raw)
-
-    @property
-    def ctrl_id(self) -> str:
-        """The current control ID."""
-        try:
-            return self.raw[self.ctrl + 1].lower()
-        except IndexError:
-            # If we've fallen in here, it's mostly because we've run into
-            # some situation where there's a lone ^ at the end of the line.
-            # This feels like a detail that the user-level code should not
-            # be having to faff with. I feel that, as much as possible, the
-            # parsing code should do its absolute best to return something
-            # readable when faced with invalid markup.
-            return ""
-
 
 ##############################################################################
 class BaseParser:
     """The base text parsing class."""
 
+    __slots__ = ()
+
     def __init__(self, line: str) -> None:
         """Constructor.
 
@@ -85,50 +98,36 @@ class BaseParser:
         """
 
         # State tracker.
-        state = ParseState(line)
-
-        # While we've not run out of text to process...
-        while state.work_left:
-            # If there was text between the last markup and the next...
-            if len(state.raw[: state.ctrl]) > 0:
-                # ...handle it.
-                self.text(state.raw[: state.ctrl])
-
-            # Pull out the character following the control character and
-            # handle it.
-            if (ctrl := state.ctrl_id) == CTRL_CHAR:
+        state = ParseState()
+
+        # Work through each run of text, or piece of markup, in the line.
+        for token in MARKUP.finditer(line):
+            if (run := token[0])[0] != CTRL_CHAR:
+                # It's plain text, handle it as is.
+                self.text(run)
+            elif (ctrl := token[1]) is None:
+                # No idea what follows the control character. We could
+                # either raise an exception, eat the next character, or
+                # simply skip along one. For now, let's just skip the
+                # control character.
+                continue
+            elif ctrl == CTRL_CHAR:
                 # We're looking at ^^, which is a ^.
                 self.text(CTRL_CHAR)
-                state.ctrl += 2
-            elif hasattr(self, f"_ctrl_{ctrl}"):
-                # Looks like we can handle whatever's there, so dispatch
-                # it...
-                getattr(self, f"_ctrl_{ctrl}")(state)
             else:
-                # No idea what the next character is. We could either raise
-                # an exception, eat the next character, or simply skip along
-                # one. For now, let's just skip along one.
-                state.ctrl += 1
-
-            # Chop the bits we've done off the raw string.
-            state.raw = state.raw[state.ctrl :]
-
-            # Find the next control character.
-            state.ctrl = state.raw.find(CTRL_CHAR)
-
-        # Handle any remaining text.
-        if len(state.raw) > 0:
-            self.text(state.raw)
+                # Looks like we can handle whatever's there, so dispatch it.
+                self._DISPATCH[ctrl[0]](self, state, ctrl[1:])
 
-    def _ctrl_a(self, state: ParseState) -> None:
+    def _ctrl_a(self, state: ParseState, arg: str) -> None:
         """Handle ^A markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup.
         """
 
         # Get the actual attribute.
-        attr = int(state.raw[state.ctrl + 2 : state.ctrl + 4], 16)
+        attr = HEX[arg] if arg in HEX else int(arg, 16)
 
         # If there's already a colour attribute in effect and the
         # new colour is the same as the previous colour...
@@ -142,15 +141,14 @@ class BaseParser:
             state.last_attr = attr
             state.mode = TextMode.ATTR
 
-        # Skip.
-        state.ctrl += 4
-
-    def _ctrl_b(self, state: ParseState) -> None:
+    def _ctrl_b(self, state: ParseState, arg: str) -> None:
         """Handle ^B markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup (unused).
         """
+        del arg
 
         # If we're in bold mode...
         if state.mode is TextMode.BOLD:
@@ -162,34 +160,35 @@ class BaseParser:
             self.bold()
             state.mode = TextMode.BOLD
 
-        # Skip!
-        state.ctrl += 2
-
-    def _ctrl_c(self, state: ParseState) -> None:
+    def _ctrl_c(self, state: ParseState, arg: str) -> None:
         """Handle ^C markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup.
         """
-        self.char(int(state.raw[state.ctrl + 2 : state.ctrl + 4], 16))
-        state.ctrl += 4
+        del state
+        self.char(HEX[arg] if arg in HEX else int(arg, 16))
 
-    def _ctrl_n(self, state: ParseState) -> None:
+    def _ctrl_n(self, state: ParseState, arg: str) -> None:
         """Handle ^N markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup (unused).
         """
+        del arg
         self.normal()
         state.mode = TextMode.NORMAL
-        state.ctrl += 2
 
-    def _ctrl_r(self, state: ParseState) -> None:
+    def _ctrl_r(self, state: ParseState, arg: str) -> None:
         """Handle ^R markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup (unused).
         """
+        del arg
 
         # If we're in reverse mode...
         if state.mode is TextMode.REVERSE:
@@ -201,15 +200,14 @@ class BaseParser:
             self.reverse()
             state.mode = TextMode.REVERSE
 
-        # Skip!
-        state.ctrl += 2
-
-    def _ctrl_u(self, state: ParseState) -> None:
+    def _ctrl_u(self, state: ParseState, arg: str) -> None:
         """Handle ^U markup.
 
         Args:
             state: The data that tracks parse state.
+            arg: The argument for the markup (unused).
         """
+        del arg
 
         # If we're in underline mode...
         if state.mode is TextMode.UNDERLINE:
@@ -221,8 +219,21 @@ class BaseParser:
             self.underline()
             state.mode = TextMode.UNDERLINE
 
-        # Skip!
-        state.ctrl += 2
+    _DISPATCH: ClassVar[dict[str, Callable[[BaseParser, ParseState, str], None]]] = {
+        "A": _ctrl_a,
+        "a": _ctrl_a,
+        "B": _ctrl_b,
+        "b": _ctrl_b,
+        "C": _ctrl_c,
+        "c": _ctrl_c,
+        "N": _ctrl_n,
+        "n": _ctrl_n,
+        "R": _ctrl_r,
+        "r": _ctrl_r,
+        "U": _ctrl_u,
+        "u": _ctrl_u,
+    }
+    """Map of markup control characters to the methods that handle them."""
 
     def text(self, text: str) -> None:
         """Handle the given text.
@@ -270,18 +281,68 @@ class BaseParser:
         del char  # pragma: no cover
 
 
+##############################################################################
+def _plain_markup(markup: re.Match[str]) -> str:
+    """Get the plain text version of a piece of markup.
+
+    Args:
+        markup: The markup to convert.
+
+    Returns:
+        The plain text for the markup.
+    """
+    if (ctrl := markup[1]) is None:
+        return ""
+    if ctrl == CTRL_CHAR:
+        return CTRL_CHAR
+    if ctrl[0] in "Cc":
+        return CHARS.get(arg := ctrl[1:]) or chr(int(arg, 16))
+    if ctrl[0] in "Aa":
+        # A colour attribute is dropped, but it still has to be valid.
+        if (arg := ctrl[1:]) not in HEX:
+            int(arg, 16)
+    return ""
+
+
+##############################################################################
+@lru_cache(maxsize=4096)
+def _plain_text(line: str) -> str:
+    """Get the plain text version of a line of Norton Guide text.
+
+    Args:
+        line: The line to convert.
+
+    Returns:
+        The line with all of its markup handled.
+
+    Note:
+        Guides often repeat the same line (rules, headings, blank lines and
+        the like), so the results are cached.
+    """
+    return CTRL_MARKUP.sub(_plain_markup, line)
+
+
 ##############################################################################
 class PlainText(BaseParser):
     """Read a line of Norton Guide text as plain text."""
 
+    __slots__ = ("_parts",)
+
     def __init__(self, line: str) -> None:
-        # We're going to accumulate the text into a hidden instance variable.
-        self._text = ""
-        # Having set the above up, go parse.
-        super().__init__(line)
+        # We're going to accumulate the pieces of text into a hidden
+        # instance variable, and only join them up when asked for the text.
+        self._parts: list[str] = []
+        # If we're exactly a plain text parser then none of the events
+        # matter, only the text they leave behind; so rather than dispatch
+        # every event we can convert all of the markup in one pass.
+        if self.__class__ is PlainText:
+            self._parts.append(_plain_text(line))
+        else:
+            # Having set the above up, go parse.
+            super().__init__(line)
 
     def text(self, text: str) -> None:
-        self._text += text
+        self._parts.append(text)
 
     def char(self, char: int) -> None:
         self.text(chr(char))
@@ -292,7 +353,7 @@ class PlainText(BaseParser):
         Returns:
             The parsed line, as plan text.
         """
-        return self._text
+        return "".join(self._parts)
 
 
 ##############################################################################
@@ -303,6 +364,8 @@ class MarkupText(PlainText, ABC):
     implement start and end tags where necessary.
     """
 
+    __slots__ = ("_stack",)
+
     def __init__(self, line: str) -> None:
         # We're going to keep a stack of the markup.
         self._stack: list[str] = []
@@ -344,12 +407,12 @@ class MarkupText(PlainText, ABC):
             the same class will be placed on an internal stack, for use when
             ``end_markup`` is called.
         """
-        self._text += self.open_markup(cls)
+        self._parts.append(self.open_markup(cls))
         self._stack.append(self.close_markup(cls))
 
     def end_markup(self) -> None:
         """End a section of markup."""
-        self._text += self._stack.pop()
+        self._parts.append(self._stack.pop())
 
     def normal(self) -> None:
         """Handle being asked to go to normal mode.
@@ -357,7 +420,7 @@ class MarkupText(PlainText, ABC):
         Note:
             Internally this also clears the whole stack of closing tags.
         """
-        self._text += "".join(reversed(self._stack))
+        self._parts.extend(reversed(self._stack))
         self._stack = []
 
     def __str__(self) -> str:
@@ -378,8 +441,13 @@ class RichText(MarkupText):
         See https://rich.readthedocs.io/en/stable/protocol.html
     """
 
+    __slots__ = ()
+
+    TEXT_MAP: Final[dict[int, str]] = {**DOS_MAP, ord("["): r"\["}
+    """Map for making text DOS-a-like and escaping Rich markup, in one go."""
+
     def text(self, text: str) -> None:
-        super().text(make_dos_like(text).replace("[", r"\["))
+        super().text(text.translate(self.TEXT_MAP))
 
     def open_markup(self, cls: str) -> str:
         return f"[{cls}]"
@@ -17,6 +17,8 @@ from .link import Link
 class PromptCollection:
     """Base class for classes that contain prompt/offset collections."""
 
+    __slots__ = ("_count", "_prompts", "_offsets")
+
     MAX_PROMPT_LENGTH: Final[int] = 128
     """The maximum length of a prompt in a guide."""
 
@@ -1,8 +1,15 @@
 """Class for handling the low-level reading of a Norton Guide database."""
 
+##############################################################################
+# Python compatibility hackage.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
-import io
+import mmap
+import os
+import re
+import struct
 from pathlib import Path
 from typing import Final
 
@@ -10,25 +17,85 @@ from typing import Final
 # Typing backward compatibility.
 from typing_extensions import Self
 
+##############################################################################
+# Local imports.
+from .types import NGEOF
+
+##############################################################################
+DECRYPT_KEY: Final[int] = 0x1A
+"""The value that every byte in a guide is XORed with to encrypt it."""
+
+DECRYPT_TABLE: Final[bytes] = bytes(byte ^ DECRYPT_KEY for byte in range(256))
+"""Translation table for decrypting a run of bytes in one go."""
+
+WORD: Final[struct.Struct] = struct.Struct("<H")
+"""The layout of a two-byte word in a guide."""
+
+LONG: Final[struct.Struct] = struct.Struct("<L")
+"""The layout of a four-byte long word in a guide."""
+
+WORD_DECRYPT_KEY: Final[int] = DECRYPT_KEY * 0x0101
+"""The value a whole word is XORed with to decrypt it."""
+
+LONG_DECRYPT_KEY: Final[int] = DECRYPT_KEY * 0x01010101
+"""The value a whole long word is XORed with to decrypt it."""
+
+NO_OFFSET: Final[bytes] = bytes((0xFF ^ DECRYPT_KEY,)) * LONG.size
+"""The raw, encrypted, form of an offset that means 'there is no offset'."""
+
+NUL: Final[dict[bool, bytes]] = {False: b"\0", True: bytes((DECRYPT_KEY,))}
+"""The raw form of a nul, keyed on whether or not it's encrypted."""
+
+RLE_BYTE: Final[int] = 0xFF
+"""The byte value that marks run-length-encoded spaces."""
+
+RLE_RUN: Final[re.Pattern[str]] = re.compile(f"{chr(RLE_BYTE)}(.?)", re.DOTALL)
+"""Regular expression that matches a run-length-encoded run of spaces."""
+
+RLE_SPACES: Final[dict[str, str]] = {
+    **{chr(count): " " * count for count in range(RLE_BYTE)},
+    chr(RLE_BYTE): " ",
+    "": " ",
+}
+"""Lookup of the count that follows an RLE marker to the spaces it expands to.
+
+Note:
+    A marker followed by another marker, or by nothing at all, is treated as
+    a single space.
+"""
+
+
+##############################################################################
+def _expand_run(run: re.Match[str]) -> str:
+    """Expand a single run-length-encoded run of spaces.
+
+    Args:
+        run: The match for the run.
+
+    Returns:
+        The spaces the run expands to.
+    """
+    return RLE_SPACES.get(run[1]) or " " * ord(run[1])
+
 
 ##############################################################################
 class GuideReader:
     """Low-level guide reading class.
 
     Note:
-        For now, no optimisation has taken place, in many cases the way this
-        class reads data from a guide will be a method that's on the slower
-        side. This is on purpose; it's about readable code that represents
-        the underlying data structure rather than the fastest method of
-        getting data into memory.
-
-        Once the rest of the library is done and working well this extra bit
-        if docstring will likely be removed because work to improve the
-        speed of this class will finally take place.
+        The guide is memory-mapped when it's opened, and all reading is done
+        from that mapping; this means that moving around the guide is just a
+        matter of changing a number, and reading a value is a slice or an
+        unpack of the mapped data rather than a call into the file system.
     """
 
+    __slots__ = ("_h", "_data", "_pos")
+
+    ENTRY_HEADER_SIZE: Final[int] = 26
+    """The size of the header that comes before the body of every entry."""
+
     #: The value that marks run-length-encoded spaces.
-    RLE_MARKER: Final[str] = "\xFF"
+    RLE_MARKER: Final[str] = chr(RLE_BYTE)
 
     @classmethod
     def unrle(cls, rle_text: str) -> str:
@@ -49,18 +116,7 @@ class GuideReader:
         sense.
         """
 
-        expanded = ""
-        start = 0
-        split = rle_text.find(cls.RLE_MARKER)
-
-        while split > -1:
-            expanded += rle_text[start:split] + " " * (
-                1 if rle_text[split + 1] == cls.RLE_MARKER else ord(rle_text[split + 1])
-            )
-            start = split + 2
-            split = rle_text.find(cls.RLE_MARKER, start)
-
-        return expanded + rle_text[start:]
+        return RLE_RUN.sub(_expand_run, rle_text)
 
     def __init__(self, guide: Path):
         """Constructor.
@@ -69,15 +125,30 @@ class GuideReader:
             guide: The guide to open.
         """
         self._h = guide.open("rb")
+        # Note that an empty file can't be mapped, so we simply stand in an
+        # empty buffer for one of those.
+        self._data: mmap.mmap | bytes = (
+            mmap.mmap(self._h.fileno(), 0, access=mmap.ACCESS_READ)
+            if os.fstat(self._h.fileno()).st_size
+            else b""
+        )
+        self._pos = 0
 
     def close(self) -> None:
         """Close the guide."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
         self._h.close()
 
+    @property
+    def size(self) -> int:
+        """The size of the guide in bytes."""
+        return len(self._data)
+
     @property
     def pos(self) -> int:
         """The current position within the file."""
-        return self._h.tell()
+        return self._pos
 
     def goto(self, pos: int) -> "GuideReader":
         """Go to a specific byte position within the guide.
@@ -88,7 +159,7 @@ class GuideReader:
         Returns:
             self
         """
-        self._h.seek(pos)
+        self._pos = pos
         return self
 
     @property
@@ -108,28 +179,84 @@ class GuideReader:
         Note:
             If ``count`` isn't supplied then 1 byte is skipped.
         """
-        self._h.seek(count, io.SEEK_CUR)
+        self._pos += count
         return self
 
+    def _read(self, length: int) -> bytes:
+        """Read raw bytes from the current position in the guide.
+
+        Args:
+            length: The number of bytes to read.
+
+        Returns:
+            The bytes read.
+
+        Note:
+            As with reading from a file, fewer bytes than were asked for
+            will be returned if the end of the guide gets in the way.
+        """
+        buff = self._data[self._pos : self._pos + length]
+        self._pos += len(buff)
+        return buff
+
+    def _read_exactly(self, length: int) -> bytes:
+        """Read an exact number of raw bytes from the guide.
+
+        Args:
+            length: The number of bytes to read.
+
+        Returns:
+            The bytes read.
+
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+        """
+        if len(buff := self._read(length)) < length:
+            raise NGEOF(f"Unexpected end of guide at {self._pos}")
+        return buff
+
+    def _unpack(self, layout: struct.Struct) -> int:
+        """Unpack a numeric value from the current position in the guide.
+
+        Args:
+            layout: The layout of the value to unpack.
+
+        Returns:
+            The raw value, still encrypted.
+
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+        """
+        try:
+            value: int = layout.unpack_from(self._data, self._pos)[0]
+        except struct.error:
+            raise NGEOF(f"Unexpected end of guide at {self._pos}") from None
+        self._pos += layout.size
+        return value
+
     def skip_entry(self) -> Self:
         """Skip a whole entry in the guide.
 
         Returns:
             self
         """
-        return self.skip(2).skip(self.read_word() + 22)
+        return self.skip(2).skip(self.read_word() + self.ENTRY_HEADER_SIZE - 4)
 
-    @staticmethod
-    def _decrypt(value: int) -> int:
-        """Decrypt a given numeric value.
+    def skip_entry_known(self, size: int) -> Self:
+        """Skip a whole entry in the guide when its size is already known.
 
         Args:
-            value: The value to decrypt.
+            size: The size of the body of the entry, as given in its header.
 
         Returns:
-            The decrypted value.
+            self
+
+        Note:
+            This assumes that the current location is the start of the
+            entry; unlike ``skip_entry`` there's no need to read the size
+            from the guide, so the skip is done in one go.
         """
-        return value ^ 0x1A
+        return self.skip(size + self.ENTRY_HEADER_SIZE)
 
     def read_byte(self, decrypt: bool = True) -> int:
         """Read a byte from the guide.
@@ -140,11 +267,18 @@ class GuideReader:
         Returns:
             The byte value read.
 
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        buff = self._h.read(1)[0]
-        return self._decrypt(buff) if decrypt else buff
+        try:
+            buff = self._data[self._pos]
+        except IndexError:
+            raise NGEOF(f"Unexpected end of guide at {self._pos}") from None
+        self._pos += 1
+        return buff ^ DECRYPT_KEY if decrypt else buff
 
     def read_word(self, decrypt: bool = True) -> int:
         """Read a two-byte word from the guide.
@@ -155,10 +289,14 @@ class GuideReader:
         Returns:
             The word value read.
 
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        return self.read_byte(decrypt) + (self.read_byte(decrypt) << 8)
+        value = self._unpack(WORD)
+        return value ^ WORD_DECRYPT_KEY if decrypt else value
 
     def peek_word(self, decrypt: bool = True) -> int:
         """Read a two-byte word but don't move the file location.
@@ -169,13 +307,15 @@ class GuideReader:
         Returns:
             The word value read.
 
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        try:
-            return self.read_word(decrypt)
-        finally:
-            self.skip(-2)
+        value = self.read_word(decrypt)
+        self.skip(-WORD.size)
+        return value
 
     def read_long(self, decrypt: bool = True) -> int:
         """Read a four-byte long word from the guide.
@@ -186,10 +326,14 @@ class GuideReader:
         Returns:
             The long integer value read.
 
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        return self.read_word(decrypt) + (self.read_word(decrypt) << 16)
+        value = self._unpack(LONG)
+        return value ^ LONG_DECRYPT_KEY if decrypt else value
 
     def read_offset(self) -> int:
         """Read an offset value from the guide.
@@ -197,23 +341,73 @@ class GuideReader:
         Returns:
             The offset value read.
 
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
         Note:
             This function ensures that an offset value that means 'there is
             no offset' returns as ``-1``.
         """
-        return -1 if (offset := self.read_long(True)) == 0xFFFFFFFF else offset
+        if (raw := self._read_exactly(LONG.size)) == NO_OFFSET:
+            return -1
+        offset: int = LONG.unpack(raw)[0]
+        return offset ^ LONG_DECRYPT_KEY
+
+    def read_offsets(self, count: int) -> tuple[int, ...]:
+        """Read a run of consecutive offset values from the guide.
+
+        Args:
+            count: The number of offsets to read.
+
+        Returns:
+            The offset values read.
+
+        Raises:
+            NGEOF: If the end of the guide gets in the way.
+
+        Note:
+            As with ``read_offset``, any offset value that means 'there is
+            no offset' is returned as ``-1``.
+        """
+        return tuple(
+            -1 if offset == 0xFFFFFFFF else offset
+            for offset in struct.unpack(
+                f"<{count}L",
+                self._read_exactly(count * LONG.size).translate(DECRYPT_TABLE),
+            )
+        )
+
+    @staticmethod
+    def _nul_at(buff: bytes, decrypt: bool) -> int:
+        """Find the location of the first nul in some raw bytes.
+
+        Args:
+            buff: The raw bytes to look in.
+            decrypt: Are the bytes encrypted?
+
+        Returns:
+            The location of the first nul, or the length of the bytes if
+            there is no nul.
+
+        Note:
+            The search is done on the raw bytes so that we don't bother
+            decrypting and decoding whatever padding follows the nul.
+        """
+        nul = buff.find(DECRYPT_KEY if decrypt else 0)
+        return len(buff) if nul == -1 else nul
 
     @staticmethod
-    def _nul_trim(string: str) -> str:
-        """Trim a string from the first nul.
+    def _decode(buff: bytes, decrypt: bool) -> str:
+        """Turn some raw bytes from the guide into a string.
 
         Args:
-            string: The string to trim.
+            buff: The raw bytes to turn into a string.
+            decrypt: Should the bytes be decrypted?
 
         Returns:
-            Everything up to but not including the first nul.
+            The string.
         """
-        return string[0:nul] if (nul := string.find("\000")) != -1 else string
+        return (buff.translate(DECRYPT_TABLE) if decrypt else buff).decode("latin-1")
 
     def read_str(self, length: int, decrypt: bool = True) -> str:
         """Read a fixed-length string from the guide.
@@ -228,12 +422,8 @@ class GuideReader:
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        return self._nul_trim(
-            "".join(
-                chr(self._decrypt(n) if decrypt else n)
-                for n in tuple(self._h.read(length))
-            )
-        )
+        buff = self._read(length)
+        return self._decode(buff[: self._nul_at(buff, decrypt)], decrypt)
 
     def read_strz(self, length: int, decrypt: bool = True) -> str:
         """Read a nul-terminated string from the guide.
@@ -253,14 +443,16 @@ class GuideReader:
         Note:
             ``decrypt`` is optional and defaults to ``True``.
         """
-        # Remember where we are before we read in the string.
-        pos = self.pos
-        # Now read in the string.
-        buff = self.read_str(length, decrypt)
-        # Now skip to the location where the nul was found.
-        self.goto(pos + len(buff) + 1)
+        # Work out the furthest the string could go, and then look for
+        # where it actually ends.
+        start = self._pos
+        end = max(start, min(start + length, self.size))
+        if (nul := self._data.find(NUL[decrypt], start, end)) == -1:
+            nul = end
+        # Now settle on the location just after the nul.
+        self._pos = nul + 1
         # Return the string.
-        return buff
+        return self._decode(self._data[start:nul], decrypt)
 
 
 ### reader.py ends here
@@ -15,6 +15,8 @@ from .reader import GuideReader
 class SeeAlso(PromptCollection):
     """Class to load and hold all the see alsos for a long entry."""
 
+    __slots__ = ()
+
     MAX_SEE_ALSO: Final[int] = 20
     """Max number of see also items we'll handle.
 
@@ -50,7 +52,7 @@ class SeeAlso(PromptCollection):
             self._count = min(guide.read_word(), self.MAX_SEE_ALSO)
 
             # Get the offsets for each of the see-also entries.
-            self._offsets = tuple(guide.read_offset() for _ in range(len(self)))
+            self._offsets = guide.read_offsets(len(self))
 
             # Get the prompts for each of the see-also items.
             self._prompts = tuple(
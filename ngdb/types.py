@@ -1,8 +1,13 @@
 """Defines helpful types and values for the library.."""
 
+##############################################################################
+# Python compatibility hackage.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
 from enum import Enum
+from typing import Final
 
 
 ##############################################################################
@@ -33,6 +38,24 @@ class EntryType(Enum):
     MENU = 2
     """The record ID for a menu in a Norton Guide database."""
 
+    @staticmethod
+    def classify(test: int) -> EntryType:
+        """Get the type of entry for a given record ID.
+
+        Args:
+            test: The record ID to classify.
+
+        Returns:
+            The type of entry the ID is for.
+
+        Raises:
+            UnknownEntryType: If the value isn't a known record ID.
+        """
+        try:
+            return ENTRY_TYPES[test]
+        except KeyError:
+            raise UnknownEntryType(f"Unknown guide entry type: {test}") from None
+
     @classmethod
     def is_short(cls, test: int) -> bool:
         """Is the value the ID of a short entry?
@@ -42,8 +65,11 @@ class EntryType(Enum):
 
         Returns:
             ``True`` if it is a short, ``False`` if not.
+
+        Raises:
+            UnknownEntryType: If the value isn't a known record ID.
         """
-        return cls(test) is cls.SHORT
+        return cls.classify(test) is cls.SHORT
 
     @classmethod
     def is_long(cls, test: int) -> bool:
@@ -54,8 +80,11 @@ class EntryType(Enum):
 
         Returns:
             ``True`` if it is a long, ``False`` if not.
+
+        Raises:
+            UnknownEntryType: If the value isn't a known record ID.
         """
-        return cls(test) is cls.LONG
+        return cls.classify(test) is cls.LONG
 
     @classmethod
     def is_menu(cls, test: int) -> bool:
@@ -66,8 +95,18 @@ class EntryType(Enum):
 
         Returns:
             ``True`` if it is a menu, ``False`` if not.
+
+        Raises:
+            UnknownEntryType: If the value isn't a known record ID.
         """
-        return cls(test) is cls.MENU
+        return cls.classify(test) is cls.MENU
+
+
+##############################################################################
+ENTRY_TYPES: Final[dict[int, EntryType]] = {
+    entry_type.value: entry_type for entry_type in EntryType
+}
+"""Lookup of record ID to the type of entry it's for."""
 
 
 ### types.py ends here
@@ -1,9 +1,17 @@
 """ngdb unit tests."""
 
+##############################################################################
+# Python compatibility hackage.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
 from pathlib import Path
 
+##############################################################################
+# Library imports.
+from ngdb import NortonGuide
+
 ##############################################################################
 # Test database names.
 GUIDES_BASE = Path(__name__).resolve() / "guides"
@@ -11,4 +19,42 @@ GOOD_GUIDE = GUIDES_BASE / "eg.ng"
 BIG_GUIDE = GUIDES_BASE / "oslib.ng"
 MISSING_GUIDE = GUIDES_BASE / "does-not-exist.ng"
 
+
+##############################################################################
+_SHARED_GUIDES: dict[Path, NortonGuide] = {}
+"""The guides that are currently being shared between tests."""
+
+
+##############################################################################
+def shared_guide(guide: Path) -> NortonGuide:
+    """Get a guide that is shared between tests.
+
+    Args:
+        guide: The path to the guide.
+
+    Returns:
+        An open guide, which will be the same guide for every call with the
+        same path.
+
+    Note:
+        Because the guide is shared, tests that use it shouldn't make any
+        assumptions about its current location; always start with a
+        ``goto_first`` or similar.
+
+        Any test module that makes use of this should call
+        ``close_shared_guides`` in its ``tearDownModule``.
+    """
+    if guide not in _SHARED_GUIDES:
+        _SHARED_GUIDES[guide] = NortonGuide(guide)
+    return _SHARED_GUIDES[guide]
+
+
+##############################################################################
+def close_shared_guides() -> None:
+    """Close and forget all of the guides being shared between tests."""
+    for guide in _SHARED_GUIDES.values():
+        guide.close()
+    _SHARED_GUIDES.clear()
+
+
 ### __init__.py ends here
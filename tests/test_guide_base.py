@@ -2,11 +2,13 @@
 
 ##############################################################################
 # Python imports.
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 ##############################################################################
 # Library imports.
-from ngdb import NortonGuide
+from ngdb import NGEOF, NortonGuide
 
 ##############################################################################
 # Local imports.
@@ -35,6 +37,16 @@ class TestOpen(TestCase):
             self.assertTrue(guide.is_open)
         self.assertFalse(guide.is_open)
 
+    def test_open_truncated_guide(self) -> None:
+        """Opening a truncated guide should throw the correct exception."""
+        with TemporaryDirectory() as tmp:
+            truncated = Path(tmp) / "truncated.ng"
+            for length in (0, 2, 12):
+                with self.subTest(length=length):
+                    truncated.write_bytes(GOOD_GUIDE.read_bytes()[:length])
+                    with self.assertRaises(NGEOF):
+                        _ = NortonGuide(truncated)
+
 
 ##############################################################################
 # Test str()ing the guide object.
@@ -46,4 +58,34 @@ class TestStr(TestCase):
         self.assertEqual(str(NortonGuide(GOOD_GUIDE)), str(GOOD_GUIDE))
 
 
+##############################################################################
+# Test spotting likely guides by name.
+class TestMaybe(TestCase):
+    """Test the guide name checking code."""
+
+    def test_maybe_guide(self) -> None:
+        """Names with a Norton Guide suffix should be a maybe."""
+        for candidate in ("foo.ng", "foo.NG", "foo.Ng", "foo.nG", ".ng.ng"):
+            with self.subTest(candidate=candidate):
+                self.assertTrue(NortonGuide.maybe(candidate))
+                self.assertTrue(NortonGuide.maybe(Path(candidate)))
+
+    def test_maybe_not_guide(self) -> None:
+        """Names without a Norton Guide suffix should not be a maybe."""
+        for candidate in (
+            "",
+            "ng",
+            "ng.",
+            ".ng",
+            "foo",
+            "foo.txt",
+            "foo.ng.",
+            "foo.ngng",
+            "foo.ng.gz",
+        ):
+            with self.subTest(candidate=candidate):
+                self.assertFalse(NortonGuide.maybe(candidate))
+                self.assertFalse(NortonGuide.maybe(Path(candidate)))
+
+
 ### test_guide_base.py ends here
@@ -13,6 +13,14 @@ from ngdb.types import EntryType
 # Local imports.
 from . import BIG_GUIDE
 
+##############################################################################
+# Expected values for the first line of the test short entry.
+EXPECTED_SHORT_LINE = (
+    " OL_95AppTitle()          Set/get the Windows 95 application title."
+)
+EXPECTED_SHORT_OFFSET = 1389
+EXPECTED_SHORT_ENTRY = (EXPECTED_SHORT_LINE, EXPECTED_SHORT_OFFSET)
+
 
 ##############################################################################
 # Unknown entry type tests.
@@ -24,15 +32,25 @@ class TestUnknown(TestCase):
         with self.assertRaises(UnknownEntryType):
             NortonGuide(BIG_GUIDE).goto(0).load()
 
+    def test_unknown_id(self) -> None:
+        """Testing an unknown entry type ID should result in an exception."""
+        for test in (EntryType.is_short, EntryType.is_long, EntryType.is_menu):
+            with self.assertRaises(UnknownEntryType):
+                test(42)
+
 
 ##############################################################################
 # Test loading up a short entry.
 class TestShort(TestCase):
     """Short entry loading unit tests."""
 
-    def setUp(self) -> None:
+    entry: Short
+    """The short entry under test."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up for testing the short entry."""
-        self.entry = NortonGuide(BIG_GUIDE).goto_first().load()
+        cls.entry = NortonGuide(BIG_GUIDE).goto_first().load()
 
     def test_load_correct_type(self) -> None:
         """A short entry should load as the correct type."""
@@ -75,7 +93,7 @@ class TestShort(TestCase):
     def test_str_entry(self) -> None:
         """The str() of the entry should be the main text."""
         str_entry = str(self.entry)
-        self.assertEqual(len(str_entry.split("\n")), len(self.entry))
+        self.assertEqual(str_entry.count("\n") + 1, len(self.entry))
 
     def test_lines_and_offsets(self) -> None:
         """There should be equal numbers of lines and offsets."""
@@ -83,29 +101,14 @@ class TestShort(TestCase):
 
     def test_list_like(self) -> None:
         """It should be possible to treat a short entry like a list."""
-        self.assertEqual(
-            self.entry[0],
-            (
-                " OL_95AppTitle()          Set/get the Windows 95 application title.",
-                1389,
-            ),
-        )
-        self.assertEqual(
-            self.entry[0].text,
-            " OL_95AppTitle()          Set/get the Windows 95 application title.",
-        )
-        self.assertEqual(self.entry[0].offset, 1389)
+        self.assertEqual(self.entry[0], EXPECTED_SHORT_ENTRY)
+        self.assertEqual(self.entry[0].text, EXPECTED_SHORT_LINE)
+        self.assertEqual(self.entry[0].offset, EXPECTED_SHORT_OFFSET)
         self.assertTrue(self.entry[0].has_offset)
 
     def test_iter_iter(self) -> None:
         """It should be possible to treat a short entry like an iterator."""
-        self.assertEqual(
-            next(iter(self.entry)),
-            (
-                " OL_95AppTitle()          Set/get the Windows 95 application title.",
-                1389,
-            ),
-        )
+        self.assertEqual(next(iter(self.entry)), EXPECTED_SHORT_ENTRY)
 
 
 ##############################################################################
@@ -113,9 +116,13 @@ class TestShort(TestCase):
 class TestLong(TestCase):
     """Long entry loading unit tests."""
 
-    def setUp(self) -> None:
+    entry: Long
+    """The long entry under test."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up for testing the long entry."""
-        self.entry = NortonGuide(BIG_GUIDE).goto_first().skip().load()
+        cls.entry = NortonGuide(BIG_GUIDE).goto_first().skip().load()
 
     def test_load_correct_type(self) -> None:
         """A long entry should load as the correct type."""
@@ -159,7 +166,7 @@ class TestLong(TestCase):
     def test_str_entry(self) -> None:
         """The str() of the entry should be the main text."""
         str_entry = str(self.entry)
-        self.assertEqual(len(str_entry.split("\n")), len(self.entry))
+        self.assertEqual(str_entry.count("\n") + 1, len(self.entry))
 
     def test_list_like(self) -> None:
         """It should be possible to treat a long entry like a list."""
@@ -18,9 +18,18 @@ from . import GOOD_GUIDE
 class TestGoodHeader(TestCase):
     """Good Norton Guide database header tests."""
 
-    def setUp(self) -> None:
+    guide: NortonGuide
+    """The guide whose header is under test."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up for the tests."""
-        self.guide = NortonGuide(GOOD_GUIDE)
+        cls.guide = NortonGuide(GOOD_GUIDE)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Tidy up after the tests."""
+        cls.guide.close()
 
     def test_is_ng(self) -> None:
         """It should be possible to test for a valid database."""
@@ -36,7 +45,7 @@ class TestGoodHeader(TestCase):
 
     def test_credits(self) -> None:
         """The credits should read correctly."""
-        self.assertCountEqual(
+        self.assertEqual(
             self.guide.credits,
             (
                 "Expert Guide",
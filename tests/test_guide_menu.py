@@ -11,7 +11,7 @@ from ngdb.menu import Menu
 
 ##############################################################################
 # Local imports.
-from . import BIG_GUIDE
+from . import BIG_GUIDE, close_shared_guides, shared_guide
 
 
 ##############################################################################
@@ -19,9 +19,13 @@ from . import BIG_GUIDE
 class TestMenuViaShort(TestCase):
     """Norton Guide menu unit tests."""
 
-    def setUp(self) -> None:
+    guide: NortonGuide
+    """The guide whose menus are under test."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up for the tests."""
-        self.guide = NortonGuide(BIG_GUIDE)
+        cls.guide = shared_guide(BIG_GUIDE)
 
     def test_has_menus(self) -> None:
         """The test guide has the correct number of menus."""
@@ -56,4 +60,46 @@ class TestMenuViaShort(TestCase):
         self.assertTrue(self.guide.menus[0][0])
 
 
+##############################################################################
+# Test when a guide's menus are available.
+class TestMenuAvailability(TestCase):
+    """Norton Guide menu availability unit tests."""
+
+    def test_menus_after_with(self) -> None:
+        """The menus should still be available after leaving a with."""
+        with NortonGuide(BIG_GUIDE) as guide:
+            pass
+        self.assertEqual(len(guide.menus), 1)
+        self.assertEqual(guide.menus[0].title, "OSLIB")
+
+    def test_menus_after_close(self) -> None:
+        """The menus should still be available after closing the guide."""
+        guide = NortonGuide(BIG_GUIDE)
+        guide.close()
+        self.assertEqual(len(guide.menus), 1)
+        self.assertEqual(guide.menus[0].title, "OSLIB")
+
+    def test_menus_mid_navigation(self) -> None:
+        """Getting the menus shouldn't affect where we are in the guide."""
+        with NortonGuide(BIG_GUIDE) as guide:
+            before = guide.goto_first().skip().load()
+            self.assertEqual(guide.menus[0].title, "OSLIB")
+            after = guide.load()
+            self.assertEqual(after.offset, before.offset)
+            self.assertEqual(after.lines, before.lines)
+
+    def test_menus_untouched(self) -> None:
+        """A guide should work fine if its menus are never looked at."""
+        with NortonGuide(BIG_GUIDE) as guide:
+            self.assertEqual(guide.menu_count, 1)
+            self.assertEqual(sum(1 for _ in guide), 28)
+        self.assertFalse(guide.is_open)
+
+
+##############################################################################
+def tearDownModule() -> None:  # pylint: disable=invalid-name
+    """Tidy up after the tests in this module."""
+    close_shared_guides()
+
+
 ### test_guide_menu.py ends here
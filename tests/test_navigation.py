@@ -10,7 +10,7 @@ from ngdb import NGEOF, Long, NortonGuide, Short
 
 ##############################################################################
 # Local imports.
-from . import BIG_GUIDE, GOOD_GUIDE
+from . import BIG_GUIDE, GOOD_GUIDE, close_shared_guides, shared_guide
 
 
 ##############################################################################
@@ -18,17 +18,26 @@ from . import BIG_GUIDE, GOOD_GUIDE
 class TestBasicNavigation(TestCase):
     """Basic guide navigation unit tests."""
 
-    def setUp(self) -> None:
+    guide: NortonGuide
+    """The guide being navigated."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """Set up for the tests."""
-        self.guide = NortonGuide(BIG_GUIDE)
+        cls.guide = NortonGuide(BIG_GUIDE)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Tidy up after the tests."""
+        cls.guide.close()
 
     def test_go_first(self) -> None:
         """It should be possible to go to the first entry."""
-        self.assertIsInstance(NortonGuide(BIG_GUIDE).goto_first().load(), Short)
+        self.assertIsInstance(self.guide.goto_first().load(), Short)
 
     def test_skip(self) -> None:
         """It should be possible to skip an entry without reading it."""
-        self.assertIsInstance(NortonGuide(BIG_GUIDE).goto_first().skip().load(), Long)
+        self.assertIsInstance(self.guide.goto_first().skip().load(), Long)
 
 
 ##############################################################################
@@ -38,26 +47,26 @@ class TestEOF(TestCase):
 
     def test_small_eof_skip(self) -> None:
         """A guide with one entry should EOF when skipping."""
-        guide = NortonGuide(GOOD_GUIDE)
-        guide.skip()
-        self.assertTrue(guide.eof)
+        with NortonGuide(GOOD_GUIDE) as guide:
+            guide.skip()
+            self.assertTrue(guide.eof)
 
     def test_small_eof_load(self) -> None:
         """A guide with one entry should not EOF when loading."""
-        guide = NortonGuide(GOOD_GUIDE)
-        guide.load()
-        self.assertFalse(guide.eof)
+        with NortonGuide(GOOD_GUIDE) as guide:
+            guide.load()
+            self.assertFalse(guide.eof)
 
     def test_big_eof_skip(self) -> None:
         """A guide with multiple entries should not be EOF early on during skips."""
-        guide = NortonGuide(BIG_GUIDE).goto_first()
+        guide = shared_guide(BIG_GUIDE).goto_first()
         for _ in range(5):
             guide.skip()
             self.assertFalse(guide.eof)
 
     def test_big_eof_load(self) -> None:
         """A guide with multiple entries should not be EOF early on during loads."""
-        guide = NortonGuide(BIG_GUIDE).goto_first()
+        guide = shared_guide(BIG_GUIDE).goto_first()
         for _ in range(5):
             guide.load()
             guide.skip()
@@ -65,14 +74,14 @@ class TestEOF(TestCase):
 
     def test_small_eof_guard_skip(self) -> None:
         """Attempting to skip past the end of single-entry guide should throw an error."""
-        guide = NortonGuide(GOOD_GUIDE).goto_first()
+        guide = shared_guide(GOOD_GUIDE).goto_first()
         with self.assertRaises(NGEOF):
             for _ in range(100):
                 guide.skip()
 
     def test_big_eof_guard_skip(self) -> None:
         """Attempting to skip past the end of multiple-entry guide should throw an error."""
-        guide = NortonGuide(BIG_GUIDE).goto_first()
+        guide = shared_guide(BIG_GUIDE).goto_first()
         with self.assertRaises(NGEOF):
             for _ in range(100):
                 guide.skip()
@@ -85,11 +94,19 @@ class TestIter(TestCase):
 
     def test_iter_small(self) -> None:
         """It should be possible to iterate through a guide with one entry."""
-        self.assertEqual(len(list(NortonGuide(GOOD_GUIDE))), 1)
+        with NortonGuide(GOOD_GUIDE) as guide:
+            self.assertEqual(sum(1 for _ in guide), 1)
 
     def test_iter_big(self) -> None:
         """It should be possible to iterate through a guide with more than one entry."""
-        self.assertEqual(len(list(NortonGuide(BIG_GUIDE))), 28)
+        with NortonGuide(BIG_GUIDE) as guide:
+            self.assertEqual(sum(1 for _ in guide), 28)
+
+
+##############################################################################
+def tearDownModule() -> None:  # pylint: disable=invalid-name
+    """Tidy up after the tests in this module."""
+    close_shared_guides()
 
 
 ### test_navigation.py ends here
@@ -18,6 +18,11 @@ from typing_extensions import TypeAlias
 from ngdb import BaseParser, PlainText
 from ngdb.parser import RichText
 
+##############################################################################
+# A line that contains every possible ^C markup, and the events it produces.
+ALL_CHARS_LINE = "".join(f"^C{n:02x}" for n in range(256))
+ALL_CHARS_EVENTS = tuple(("C", n) for n in range(256))
+
 
 ##############################################################################
 # Plain text parser tests.
@@ -51,6 +56,10 @@ class TestPlainText(TestCase):
         """It should be able to handle character codes."""
         self.assertEqual(str(PlainText("^C20^C21")), " !")
 
+    def test_char_code_any_case(self) -> None:
+        """It should handle character codes with hex digits in any case."""
+        self.assertEqual(str(PlainText("^C4a^C4A^c4a^c4A")), "JJJJ")
+
     def test_truncated_markup(self) -> None:
         """It should handle truncated markup."""
         self.assertEqual(str(PlainText("^")), "")
@@ -59,56 +68,68 @@ class TestPlainText(TestCase):
 TEvent: TypeAlias = Union[str, Tuple[str, Any]]
 """Type of a single event that the TestParser will catch."""
 
-TEvents: TypeAlias = List[TEvent]
-"""Type of the collection of events in the TestParser."""
-
 
 ##############################################################################
 # Unit-test-oriented Norton Guide line parser.
 class TestParser(BaseParser):
     """Parser class for working with unit tests."""
 
+    __slots__ = ("_tags", "_args")
+
     def __init__(self, line: str) -> None:
         # First off, we're going to collect all the different events that
-        # happen, so start a list for doing that.
-        self._events: TEvents = []
+        # happen. Rather than build a tuple for every event, keep the tag of
+        # each event in one array, and any argument it has in another.
+        self._tags = bytearray()
+        self._args: List[Any] = []
 
         # Then call the super.
         super().__init__(line)
 
+    def _event(self, tag: str, arg: Any = None) -> None:
+        """Record an event.
+
+        Args:
+            tag: The tag for the event.
+            arg: The optional argument for the event.
+        """
+        self._tags.append(ord(tag))
+        self._args.append(arg)
+
     def text(self, text: str) -> None:
-        self._events.append(("T", text))
+        self._event("T", text)
 
     def colour(self, colour: int) -> None:
-        self._events.append(("A", colour))
+        self._event("A", colour)
 
     def normal(self) -> None:
-        self._events.append("N")
+        self._event("N")
 
     def bold(self) -> None:
-        self._events.append("B")
+        self._event("B")
 
     def unbold(self) -> None:
-        self._events.append("b")
+        self._event("b")
 
     def reverse(self) -> None:
-        self._events.append("R")
+        self._event("R")
 
     def unreverse(self) -> None:
-        self._events.append("r")
+        self._event("r")
 
     def underline(self) -> None:
-        self._events.append("U")
+        self._event("U")
 
     def ununderline(self) -> None:
-        self._events.append("u")
+        self._event("u")
 
     def char(self, char: int) -> None:
-        self._events.append(("C", char))
+        self._event("C", char)
 
     def __iter__(self) -> Iterator[TEvent]:
         """The collection of events caught by the parser."""
-        return iter(self._events)
+        for tag, arg in zip(self._tags.decode(), self._args):
+            yield tag if arg is None else (tag, arg)
 
 
 ##############################################################################
@@ -118,72 +139,67 @@ class TestParseEvents(TestCase):
 
     def test_empty_line(self) -> None:
         """There should be no events in an empty line."""
-        self.assertListEqual(list(TestParser("")), [])
+        self.assertEqual(tuple(TestParser("")), ())
 
     def test_no_markup(self) -> None:
         """There should be a single text event for a non-markup line."""
-        self.assertListEqual(
-            list(TestParser("Hello, World!")), [("T", "Hello, World!")]
-        )
+        self.assertEqual(tuple(TestParser("Hello, World!")), (("T", "Hello, World!"),))
 
     def test_colour(self) -> None:
         """There should be a colour event when there's a ^A."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^A20World!")),
-            [("T", "Hello, "), ("A", 0x20), ("T", "World!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^A20World!")),
+            (("T", "Hello, "), ("A", 0x20), ("T", "World!")),
         )
 
     def test_multi_colour(self) -> None:
         """Multiple there should be multiple colour events with multiple ^A."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^A20World^A64!")),
-            [("T", "Hello, "), ("A", 0x20), ("T", "World"), ("A", 0x64), ("T", "!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^A20World^A64!")),
+            (("T", "Hello, "), ("A", 0x20), ("T", "World"), ("A", 0x64), ("T", "!")),
         )
 
     def test_same_colour(self) -> None:
         """Two consecutive ^A of the same colour should cause a ^N."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^A20World^A20!")),
-            [("T", "Hello, "), ("A", 0x20), ("T", "World"), "N", ("T", "!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^A20World^A20!")),
+            (("T", "Hello, "), ("A", 0x20), ("T", "World"), "N", ("T", "!")),
         )
 
     def test_bold(self) -> None:
         """It should be possible to turn bold on and off with ^B."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^BWorld^B!")),
-            [("T", "Hello, "), "B", ("T", "World"), "b", ("T", "!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^BWorld^B!")),
+            (("T", "Hello, "), "B", ("T", "World"), "b", ("T", "!")),
         )
 
     def test_char(self) -> None:
         """It should be possible to generate characters with ^C."""
-        self.assertListEqual(
-            list(TestParser("".join(f"^C{n:02x}" for n in range(256)))),
-            [("C", n) for n in range(256)],
-        )
+        self.assertEqual(tuple(TestParser(ALL_CHARS_LINE)), ALL_CHARS_EVENTS)
 
     def test_normal(self) -> None:
         """A ^N markup should result in a back-to-normal event."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^NWorld!")),
-            [
+        self.assertEqual(
+            tuple(TestParser("Hello, ^NWorld!")),
+            (
                 ("T", "Hello, "),
                 "N",
                 ("T", "World!"),
-            ],
+            ),
         )
 
     def test_reverse(self) -> None:
         """It should be possible to turn reverse on and off with ^R."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^RWorld^R!")),
-            [("T", "Hello, "), "R", ("T", "World"), "r", ("T", "!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^RWorld^R!")),
+            (("T", "Hello, "), "R", ("T", "World"), "r", ("T", "!")),
         )
 
     def test_underline(self) -> None:
         """It should be possible to turn underline on and off with ^U."""
-        self.assertListEqual(
-            list(TestParser("Hello, ^UWorld^U!")),
-            [("T", "Hello, "), "U", ("T", "World"), "u", ("T", "!")],
+        self.assertEqual(
+            tuple(TestParser("Hello, ^UWorld^U!")),
+            (("T", "Hello, "), "U", ("T", "World"), "u", ("T", "!")),
         )
 
 
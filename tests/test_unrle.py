@@ -0,0 +1,47 @@
+"""Run-length-encoding expansion unit tests."""
+
+##############################################################################
+# Python imports.
+from unittest import TestCase
+
+##############################################################################
+# Library imports.
+from ngdb.reader import GuideReader
+
+
+##############################################################################
+# RLE expansion tests.
+class TestUnRLE(TestCase):
+    """Test the expansion of run-length-encoded text."""
+
+    def test_empty_string(self) -> None:
+        """An empty string should expand to an empty string."""
+        self.assertEqual(GuideReader.unrle(""), "")
+
+    def test_no_rle(self) -> None:
+        """Text with no RLE markers should come back as-is."""
+        self.assertEqual(GuideReader.unrle("Hello, World!"), "Hello, World!")
+
+    def test_only_rle(self) -> None:
+        """Text that is only an RLE run should expand to just spaces."""
+        self.assertEqual(GuideReader.unrle("\xff\x0a"), " " * 10)
+
+    def test_rle_in_text(self) -> None:
+        """An RLE run within text should expand in place."""
+        self.assertEqual(GuideReader.unrle("Hello,\xff\x05World!"), "Hello,     World!")
+
+    def test_multiple_rle(self) -> None:
+        """Multiple RLE runs should all expand."""
+        self.assertEqual(GuideReader.unrle("\xff\x02a\xff\x03b\xff\x04"), "  a   b    ")
+
+    def test_rle_of_marker(self) -> None:
+        """A marker followed by a marker should expand to a single space."""
+        self.assertEqual(GuideReader.unrle("a\xff\xffb"), "a b")
+
+    def test_trailing_marker(self) -> None:
+        """A marker with no count at the end of the text should be a space."""
+        self.assertEqual(GuideReader.unrle("\xff"), " ")
+        self.assertEqual(GuideReader.unrle("Hello\xff"), "Hello ")
+
+
+### test_unrle.py ends here